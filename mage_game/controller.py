@@ -18,33 +18,85 @@ class MouseAndKeyboard:
         event_manager.register_listener(self)
         self.model = model
 
+        # State to handler dispatch tables, so each input event costs
+        # one dict lookup rather than a comparison per game state
+        self._keydown_handlers = {
+            GameState.STATE_MENU: self.key_down_menu,
+            GameState.STATE_PLAY: self.key_down_play,
+            GameState.STATE_HELP: self.key_down_help,
+            GameState.STATE_INTRO: self.key_down_intro,
+        }
+        self._mousedown_handlers = {
+            GameState.STATE_PLAY: self.mouse_down_play,
+            GameState.STATE_INTRO: self.mouse_down_intro,
+        }
+        self._pygame_handlers = {
+            pygame.QUIT: self.quit_game,
+            pygame.KEYDOWN: self.key_down,
+            pygame.MOUSEBUTTONDOWN: self.mouse_down,
+        }
+        self._handled_types = list(self._pygame_handlers)
+        # Keycode to name cache: pygame.key.name allocates a fresh
+        # string through SDL on every call, and the bindings are
+        # compared by name, so resolve each keycode at most once
+        self._key_names: dict[int, str] = {}
+
     def notify(self, event: pygame.event.Event):
         """
-        Receive events posted to the message queue. 
+        Receive events posted to the message queue.
 
         :param event: the pygame event
         """
 
         if isinstance(event, TickEvent):
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.event_manager.post(QuitEvent())
-                if event.type == pygame.KEYDOWN:
-                    currentstate = self.model.state.peek()
-                    if currentstate == GameState.STATE_MENU:
-                        self.key_down_menu(event)
-                    if currentstate == GameState.STATE_PLAY:
-                        self.key_down_play(event)
-                    if currentstate == GameState.STATE_HELP:
-                        self.key_down_help(event)
-                    if currentstate == GameState.STATE_INTRO:
-                        self.key_down_intro(event)
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    currentstate = self.model.state.peek()
-                    if currentstate == GameState.STATE_PLAY:
-                        self.mouse_down_play(event)
-                    if currentstate == GameState.STATE_INTRO:
-                        self.mouse_down_intro(event)
+            handlers = self._pygame_handlers
+            for pygame_event in pygame.event.get(self._handled_types):
+                handler = handlers.get(pygame_event.type)
+                if handler:
+                    handler(pygame_event)
+
+    def _key_name(self, key: int) -> str:
+        """
+        Looks up the name of a keycode, caching the result so repeat
+        presses of the same key skip the SDL call.
+
+        :param key: the pygame keycode
+        :return: the name of the key
+        """
+        name = self._key_names.get(key)
+        if name is None:
+            name = self._key_names[key] = pygame.key.name(key)
+        return name
+
+    def quit_game(self, event: pygame.event.Event):
+        """
+        Handles window close events by requesting a quit.
+
+        :param event: the quit event
+        """
+        self.event_manager.post(QuitEvent())
+
+    def key_down(self, event: pygame.event.Event):
+        """
+        Routes key press events to the handler for the current
+        game state, if one exists.
+
+        :param event: the key press event
+        """
+        handler = self._keydown_handlers.get(self.model.state.peek())
+        if handler:
+            handler(event)
+
+    def mouse_down(self, event: pygame.event.Event):
+        """
+        Routes mouse press events to the handler for the current
+        game state, if one exists.
+
+        :param event: the mouse press event
+        """
+        handler = self._mousedown_handlers.get(self.model.state.peek())
+        if handler:
+            handler(event)
 
     def key_down_menu(self, event: pygame.event.Event):
         """
@@ -55,9 +107,10 @@ class MouseAndKeyboard:
         :param event: the key press event
         """
 
-        if pygame.key.name(event.key) in self.model.bindings.close_game:
+        key_name = self._key_name(event.key)
+        if key_name in self.model.bindings.close_game:
             self.event_manager.post(QuitEvent())
-        elif pygame.key.name(event.key) in self.model.bindings.close_menu:
+        elif key_name in self.model.bindings.close_menu:
             self.event_manager.post(StateChangeEvent(None))
 
     def key_down_help(self, event: pygame.event.Event):
@@ -69,7 +122,7 @@ class MouseAndKeyboard:
         :param event: the key press event
         """
 
-        if pygame.key.name(event.key) in self.model.bindings.close_help:
+        if self._key_name(event.key) in self.model.bindings.close_help:
             self.event_manager.post(StateChangeEvent(None))
 
     def key_down_play(self, event: pygame.event.Event):
@@ -80,13 +133,15 @@ class MouseAndKeyboard:
 
         :param event: the key press event
         """
-        key_name = pygame.key.name(event.key)
+        key_name = self._key_name(event.key)
         if key_name in self.model.bindings.open_menu:
             self.event_manager.post(StateChangeEvent(GameState.STATE_MENU))
         elif key_name in self.model.bindings.open_help:
             self.event_manager.post(StateChangeEvent(GameState.STATE_HELP))
-        elif key_name in self.model.bindings.select_palette_item:
-            self.event_manager.post(PaletteSelectEvent(self.model.bindings.select_palette_item.index(key_name)))
+        else:
+            index = self.model.bindings._select_palette_index.get(key_name)
+            if index is not None:
+                self.event_manager.post(PaletteSelectEvent(index))
 
     def key_down_intro(self, event: pygame.event.Event):
         """
@@ -95,7 +150,7 @@ class MouseAndKeyboard:
 
         :param event: the key press event
         """
-        if pygame.key.name(event.key) in self.model.bindings.close_game:
+        if self._key_name(event.key) in self.model.bindings.close_game:
             self.event_manager.post(StateChangeEvent(None))
 
     def mouse_down_play(self, event: pygame.event.Event):
@@ -29,10 +29,13 @@ class QuitEvent(Event):
 class TickEvent(Event):
     """
     Tick event.
+
+    :param dt: the duration of the previous frame in milliseconds.
     """
 
-    def __init__(self):
+    def __init__(self, dt: float = 0.0):
         self.name = "Tick event"
+        self.dt = dt
 
 
 class MouseEvent(Event):
@@ -4,26 +4,39 @@ class Bindings:
     This object should be saved with the game state to preserve user settings.
     All keyboard keys are stored as strings. Mouse buttons are stored as
     numbers (e.g., M1 = 1, M2 = 2, etc.).
+
+    The default bindings are class-level constants, so constructing a
+    Bindings allocates nothing; rebinding a key assigns an instance
+    attribute that shadows the class default for that binding only.
+    Bindings that are only ever membership tested are stored as
+    frozensets for constant time lookups on the event hot path;
+    select_palette_item stays ordered because its position doubles
+    as the palette index.
     """
 
-    def __init__(self):
-        # Game buttons
-        self.close_game = ["escape"]
-        self.select_palette_item = ["1", "2", "3", "4"]
-        self.move_character = ["a", "s", "d", "w"]
-        self.cast = [1]
+    # Game buttons
+    close_game = frozenset({"escape"})
+    select_palette_item = ("1", "2", "3", "4")
+    move_character = frozenset({"a", "s", "d", "w"})
+    cast = frozenset({1})
+
+    # Key to palette index lookup, so selection is a single dict
+    # get instead of a membership test plus a list scan
+    _select_palette_index = {
+        key: index for index, key in enumerate(select_palette_item)
+    }
+
+    # Menu buttons
+    open_menu = frozenset({"tab"})
+    close_menu = frozenset({"tab"})
 
-        # Menu buttons
-        self.open_menu = ["tab"]
-        self.close_menu = ["tab"]
+    # Help buttons
+    open_help = frozenset({"f1"})
+    close_help = frozenset({"escape", "f1"})
 
-        # Help buttons
-        self.open_help = ["f1"]
-        self.close_help = ["escape", "f1"]
-        
     @staticmethod
-    def render(button_list: list[str]):
-        button_list = [button.title() for button in button_list]
+    def render(buttons) -> str:
+        button_list = sorted(button.title() for button in buttons)
         if len(button_list) == 1:
             return button_list[0]
         elif len(button_list) == 2:
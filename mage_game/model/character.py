@@ -6,18 +6,29 @@ from .world import Entity, WorldPoint
 
 from .magic import *
 
-
-@dataclass
+# The elements a new character starts with, in spell book order; the
+# first four fill the palette
+_STARTING_ELEMENTS = (
+    Element.FIRE,
+    Element.WATER,
+    Element.EARTH,
+    Element.AIR,
+    Element.LIGHT,
+    Element.DARK,
+)
+
+
+@dataclass(slots=True)
 class PaletteItem:
     """
     Represents a single item in the game palette.
 
     :param Projectile spell: the spell that this item represents.
-    :param float cooldown: the remaining time on the cooldown of the spell in milliseconds.
+    :param int cooldown: the remaining time on the cooldown of the spell in whole milliseconds.
     """
 
     _spell: Projectile = field(default_factory=Projectile)
-    _cooldown: float = 0
+    _cooldown: int = 0
 
     def can_use(self) -> bool:
         """
@@ -29,9 +40,11 @@ class PaletteItem:
 
     def reset_cooldown(self) -> None:
         """
-        Resets the cooldown of the palette item.
+        Resets the cooldown of the palette item. The cooldown is
+        truncated to whole milliseconds so the per-frame countdown
+        stays in integer arithmetic.
         """
-        self._cooldown = self._spell.get_attribute(SpellAttribute.COOLDOWN)
+        self._cooldown = int(self._spell.get_attribute(SpellAttribute.COOLDOWN))
 
     def get_spell(self) -> Projectile:
         """
@@ -41,31 +54,36 @@ class PaletteItem:
         """
         return self._spell
     
-    def get_cooldown(self) -> float:
+    def get_cooldown(self) -> int:
         return self._cooldown
 
 
-@dataclass
+@dataclass(slots=True)
 class Palette:
     """
     Represents the game palette.
 
     :param list[PaletteItem] _items: the list of spells in the palette.
     :param int _current_spell_index: the index of the active spell in the palette.
-    :param int _casting_time: the amount of time it takes to finish casting a spell in milliseconds
+    :param float _casting_time: the amount of time it takes to finish casting a spell in milliseconds
     """
 
     _items: list[PaletteItem] = field(default_factory=list)
     _current_item_index: int = 0
-    _casting_time: int = 0
+    _casting_time: float = 0.0
+    _active_item: PaletteItem | None = field(default=None, compare=False)
 
     def get_active_item(self) -> PaletteItem:
         """
         Retrieves the currently active spell from the palette.
+        The lookup is cached until the selection changes, so
+        repeat calls skip the list index.
 
         :return: the currently active spell.
         """
-        return self._items[self._current_item_index]
+        if self._active_item is None:
+            self._active_item = self._items[self._current_item_index]
+        return self._active_item
 
     def get_active_item_index(self) -> int:
         """
@@ -75,16 +93,15 @@ class Palette:
         """
         return self._current_item_index
 
-    def update_cooldowns(self, dt: float) -> None:
+    def update_cooldowns(self, dt: int) -> None:
         """
         Lowers cooldowns for all spells in the palette.
 
-        :param float dt: the time in milliseconds since the last update.
+        :param int dt: the time in milliseconds since the last update.
         """
         for palette_item in self._items:
-            palette_item._cooldown -= dt
-            if palette_item._cooldown <= 0:
-                palette_item._cooldown = 0
+            if palette_item._cooldown > 0:
+                palette_item._cooldown = max(0, palette_item._cooldown - dt)
 
     def can_cast_active_spell(self) -> bool:
         """
@@ -115,6 +132,7 @@ class Palette:
         :param index: the index of the spell in the palette.
         """
         self._current_item_index = index
+        self._active_item = None
 
     def reset_casting_time(self) -> None:
         """
@@ -123,7 +141,7 @@ class Palette:
         """
         self._casting_time = self.get_active_item() \
             .get_spell() \
-            .get_attribute(SpellAttribute.CAST_TIME) * 1000
+            .get_attribute(SpellAttribute.CAST_TIME)
 
     def update_casting_time(self, dt) -> None:
         """
@@ -132,11 +150,11 @@ class Palette:
 
         :param dt: the change in time since the last time this method was called
         """
-        self._casting_time -= dt
         if self._casting_time <= 0:
-            self._casting_time = 0
+            return
+        self._casting_time = max(0.0, self._casting_time - dt)
 
-    def get_remaining_casting_time(self) -> int:
+    def get_remaining_casting_time(self) -> float:
         """
         Computes the remaining time spent casting a spell.
 
@@ -163,7 +181,7 @@ class Palette:
             return True
         return False
 
-@dataclass
+@dataclass(slots=True)
 class Character(Entity):
     """
     The Character class represents the character data.
@@ -189,14 +207,9 @@ class Character(Entity):
         :return: an instance of Character populated with defaults.
         """
         character = Character()
-        character._spell_book.extend([
-            Projectile(Element.FIRE),
-            Projectile(Element.WATER),
-            Projectile(Element.EARTH),
-            Projectile(Element.AIR),
-            Projectile(Element.LIGHT),
-            Projectile(Element.DARK),
-        ])
+        character._spell_book.extend(
+            Projectile(element) for element in _STARTING_ELEMENTS
+        )
         character._palette.get_items().extend([
             PaletteItem(spell) for spell in character._spell_book[:4]
         ])
@@ -1,8 +1,50 @@
 import math
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Callable
 
+# The cumulative event counts at which an attribute levels up
+# (10, 30, 70, ...), precomputed so leveling is an integer binary
+# search rather than a logarithm on every event.
+_LEVEL_THRESHOLDS = tuple((2 ** n - 2) * 5 for n in range(2, 34))
+
+
+@lru_cache(maxsize=256)
+def _logarithmic_scale(level: int, base: float) -> float:
+    """
+    Scales a base value up following a logarithmic growth curve.
+    Results are memoized since the (level, base) domain is tiny and
+    the same pairs are requested over and over each frame.
+
+    :param level: the level of the attribute.
+    :param base: the base value of the attribute.
+    :return: the scaled value of the attribute.
+    """
+    return base * (math.log2(level) + 1.0)
+
+
+@lru_cache(maxsize=256)
+def _inverse_scale(level: int, base: float) -> float:
+    """
+    Scales a base value down following an inverse growth curve.
+    Memoized for the same reason as :func:`_logarithmic_scale`.
+
+    :param level: the level of the attribute.
+    :param base: the base value of the attribute.
+    :return: the scaled value of the attribute.
+    """
+    return base / level
+
+
+# Scale name to function table, so effective_value resolves its curve
+# with one dict lookup instead of a string comparison per branch
+_SCALE_FUNCTIONS = {
+    "logarithmic": _logarithmic_scale,
+    "inverse": _inverse_scale,
+}
+
 
 class Element(Enum):
     """
@@ -31,19 +73,13 @@ class Element(Enum):
         return obj
 
     def __init__(self, _: int, color: tuple = (255, 255, 255)):
-        self._color = color
+        # A plain attribute rather than a property, so the per-frame
+        # draw code skips the descriptor call; the color of the
+        # element is in (r, g, b) format.
+        self.color = color
 
     def __str__(self):
-        return self.value
-
-    @property
-    def color(self) -> tuple:
-        """
-        Retrieves the color of the element.
-
-        :return: the color of the element in (r, g, b) format.
-        """
-        return self._color
+        return self.name
 
 
 class SpellAttribute(Enum):
@@ -72,10 +108,10 @@ class SpellAttribute(Enum):
     :member CRIT_DAMAGE: crit damage refers to the ratio of 
        DAMAGE to increase a hit by (e.g., .5).
     :member COOLDOWN: cooldown refers to the time the player
-       has to wait in seconds before they can cast the spell 
+       has to wait in milliseconds before they can cast the spell 
        again.
     :member CAST_TIME: cast time refers to the amount of time it
-       takes to charge up a spell in seconds. 
+       takes to charge up a spell in milliseconds. 
     :member DISTANCE: distance refers to the distance that a spell
        travels in meters.
     :member RADIUS: radius refers to the size of a spell in meters.
@@ -88,8 +124,8 @@ class SpellAttribute(Enum):
     DAMAGE = auto(), 1
     CRIT_CHANCE = auto(), .05
     CRIT_DAMAGE = auto(), .25
-    COOLDOWN = auto(), 2.0
-    CAST_TIME = auto(), 2.0
+    COOLDOWN = auto(), 2000.0
+    CAST_TIME = auto(), 2000.0
     DISTANCE = auto(), 10.0
     RADIUS = auto(), .1
     SPEED = auto(), 5.0
@@ -104,14 +140,14 @@ class SpellAttribute(Enum):
         self._base = base
 
     def __str__(self):
-        return self.value
+        return self.name
 
     @property
     def base_value(self) -> float:
         return self._base
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeTracking:
     """
     A handy class for tracking spell attributes.
@@ -130,6 +166,7 @@ class AttributeTracking:
     _scale: str = "logarithmic"
     _post: Callable = lambda x: x
     _units: str = "m"
+    _cached: float | None = field(default=None, compare=False, repr=False)
 
     def level(self) -> int:
         """
@@ -146,12 +183,16 @@ class AttributeTracking:
         values that scale up will follow a logarithmic growth curve while 
         values that scale down will follow an inverse growth curve.
 
+        The result only changes when the attribute levels up, so it is
+        cached on the instance and recomputed after :meth:`trigger_event`
+        raises the level.
+
         :return: the scaled value of the spell attribute.
         """
-        if self._scale == "logarithmic":
-            return self._post(math.log(self._level, 2) * self.attribute.base_value + self.attribute.base_value)
-        elif self._scale == "inverse":
-            return self._post(1 / (self._level) * self.attribute.base_value)
+        if self._cached is None:
+            scale = _SCALE_FUNCTIONS[self._scale]
+            self._cached = self._post(scale(self._level, self.attribute.base_value))
+        return self._cached
 
     def trigger_event(self) -> None:
         """
@@ -164,7 +205,13 @@ class AttributeTracking:
             - Level 3 -> 4: Perform 40 events (on top of the previous 30)
         """
         self._events += 1
-        self._level = int(math.log((self._events // 5) + 2, 2))
+        level = bisect_right(_LEVEL_THRESHOLDS, self._events) + 1
+        if level != self._level:
+            self._level = level
+            # Recompute eagerly so reads are always a plain attribute
+            # fetch; level ups are rare compared to value reads.
+            self._cached = None
+            self.effective_value()
 
     def events_to_next_level(self) -> int:
         """
@@ -174,11 +221,10 @@ class AttributeTracking:
 
         :return: the number of events need to reach the next level.
         """
-        next_level = self._level + 1
-        return ((2 ** next_level) - 2) * 5 - self._events
+        return _LEVEL_THRESHOLDS[self._level - 1] - self._events
 
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     """
     A projectile-based spell.
@@ -188,13 +234,13 @@ class Projectile:
     """
 
     _element: Element = Element.NONE
-    _attributes: dict[SpellAttribute: AttributeTracking] = field(default_factory=lambda: {
+    _attributes: dict[SpellAttribute, AttributeTracking] = field(default_factory=lambda: {
         SpellAttribute.SPEED: AttributeTracking(SpellAttribute.SPEED, _units="m/s"),
         SpellAttribute.RADIUS: AttributeTracking(SpellAttribute.RADIUS),
         SpellAttribute.DISTANCE: AttributeTracking(SpellAttribute.DISTANCE),
         SpellAttribute.DAMAGE: AttributeTracking(SpellAttribute.DAMAGE, _post=math.ceil, _units="hp"),
-        SpellAttribute.COOLDOWN: AttributeTracking(SpellAttribute.COOLDOWN, _scale="inverse", _units="s"),
-        SpellAttribute.CAST_TIME: AttributeTracking(SpellAttribute.CAST_TIME, _scale="inverse", _units="s"),
+        SpellAttribute.COOLDOWN: AttributeTracking(SpellAttribute.COOLDOWN, _scale="inverse", _units="ms"),
+        SpellAttribute.CAST_TIME: AttributeTracking(SpellAttribute.CAST_TIME, _scale="inverse", _units="ms"),
         SpellAttribute.CRIT_CHANCE: AttributeTracking(SpellAttribute.CRIT_CHANCE, _units="%")
     })
     # TODO: add a path field to dictate how the projectile should travel
@@ -210,12 +256,14 @@ class Projectile:
 
     def get_attribute(self, attribute: SpellAttribute) -> float:
         """
-        Retrieves the value of an attribute.
+        Retrieves the value of an attribute. The attribute is indexed
+        directly since every well-formed spell tracks all of its
+        attributes; use :meth:`get_tracking` when absence is possible.
 
         :param attribute: a spell attribute enum used for differentiating spell attributes.
         :return: the value of the attribute
         """
-        return self.get_tracking(attribute).effective_value()
+        return self._attributes[attribute].effective_value()
 
     def element(self) -> Element:
         """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+import time
 from dataclasses import dataclass
 from enum import Enum, auto
 
@@ -9,6 +10,11 @@ from .bindings import Bindings
 from .character import Character
 from .world import Entity, World
 
+# The default ceiling on engine loop iterations per second. The view
+# throttles harder with its own frame clock, so this mostly guards
+# against the loop spinning a full core when no view is listening.
+_DEFAULT_FRAME_RATE = 60
+
 
 class GameState(Enum):
     """
@@ -28,11 +34,13 @@ class GameEngine:
     Tracks the game state.
 
     :param event_manager: the event manager.
+    :param fps: the cap on engine loop iterations per second.
     """
 
-    def __init__(self, event_manager: EventManager):
+    def __init__(self, event_manager: EventManager, fps: int = _DEFAULT_FRAME_RATE):
         self.event_manager: EventManager = event_manager
         self.event_manager.register_listener(self)
+        self.fps: int = fps
         self.running: bool = False
         self.state: StateMachine = StateMachine()
         self.enemies: list[Enemy] = None
@@ -40,24 +48,46 @@ class GameEngine:
         self.world: World = None
         self.bindings: Bindings = Bindings()
 
-    def notify(self, event: EventManager) -> None:
+        # Event class to handler dispatch, so each event costs one
+        # dict lookup instead of an isinstance per handled class
+        self._handlers = {
+            QuitEvent: self._on_quit,
+            StateChangeEvent: self._on_state_change,
+        }
+
+    def notify(self, event: Event) -> None:
         """
-        Called by an event in the message queue. 
+        Called by an event in the message queue.
 
         :param event: the current event.
         """
 
-        if isinstance(event, QuitEvent):
-            self.running = False
-        if isinstance(event, StateChangeEvent):
-            # pop request
-            if not event.state:
-                # false if no more states are left
-                if not self.state.pop():
-                    self.event_manager.post(QuitEvent())
-            else:
-                # push a new state on the stack
-                self.state.push(event.state)
+        handler = self._handlers.get(type(event))
+        if handler:
+            handler(event)
+
+    def _on_quit(self, event: QuitEvent) -> None:
+        """
+        Stops the engine loop in response to a quit request.
+
+        :param event: the quit event.
+        """
+        self.running = False
+
+    def _on_state_change(self, event: StateChangeEvent) -> None:
+        """
+        Pushes or pops the game state stack. A falsy state pops; the
+        engine quits once the stack empties.
+
+        :param event: the state change event.
+        """
+        if not event.state:
+            # false if no more states are left
+            if not self.state.pop():
+                self.event_manager.post(QuitEvent())
+        else:
+            # push a new state on the stack
+            self.state.push(event.state)
 
     def new_game(self) -> None:
         """
@@ -78,15 +108,25 @@ class GameEngine:
         """
         Starts the game engine loop.
 
-        This pumps a Tick event into the message queue for each loop.
-        The loop ends when this object hears a QuitEvent in notify(). 
+        This pumps a Tick event into the message queue for each loop,
+        sleeping off any time left in the frame so the loop never spins
+        faster than the frame rate cap.
+        The loop ends when this object hears a QuitEvent in notify().
         """
         self.running = True
         self.event_manager.post(InitializeEvent())
         self.state.push(GameState.STATE_INTRO)
+        frame_seconds = 1 / self.fps
+        tick = TickEvent()
+        previous = time.monotonic()
         while self.running:
-            newTick = TickEvent()
-            self.event_manager.post(newTick)
+            now = time.monotonic()
+            tick.dt = (now - previous) * 1000
+            previous = now
+            self.event_manager.post(tick)
+            elapsed = time.monotonic() - now
+            if elapsed < frame_seconds:
+                time.sleep(frame_seconds - elapsed)
 
 
 class StateMachine(object):
@@ -99,28 +139,28 @@ class StateMachine(object):
     def __init__(self):
         self.state_stack = []
 
-    def peek(self) -> int | None:
+    def peek(self) -> GameState | None:
         """
         Without altering the stack, returns the current state.
 
         :return: the current state or None if the stack is empty.
         """
-        try:
-            return self.state_stack[-1]
-        except IndexError:
-            return None
+        stack = self.state_stack
+        return stack[-1] if stack else None
 
-    def pop(self) -> int | None:
+    def pop(self) -> bool | None:
         """
-        Remove the top state from the stack and return it.
+        Remove the top state from the stack.
 
-        :return: the current state or None if the stack is empty.
+        :return: True if states remain, False if the stack is now
+            empty, or None if there was nothing to pop.
         """
-        try:
-            self.state_stack.pop()
-            return len(self.state_stack) > 0
-        except IndexError:
+        stack = self.state_stack
+        size = len(stack)
+        if size == 0:
             return None
+        stack.pop()
+        return size > 1
 
     def push(self, state) -> int:
         """
@@ -133,7 +173,7 @@ class StateMachine(object):
         return state
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy(Entity):
     """
     The Enemy class represents enemy data.
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldPoint:
     """
     Represents a point in our game world. Our game is 2D,
@@ -16,7 +16,7 @@ class WorldPoint:
     def as_tuple(self):
         return (self.x, self.y)
     
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """
     An entity is any physical object in our game with
@@ -47,7 +47,7 @@ class Entity:
         self.coordinates.x = x
         self.coordinates.y = y
 
-@dataclass
+@dataclass(slots=True)
 class World:
     """
     Represents the game world. This object allows use to track
@@ -25,9 +25,11 @@ class CharacterCameraGroup(pygame.sprite.Group):
         """
         
         # Center camera
-        self._center_target_draw(player) 
-        
-        # Draw sprites
-        for sprite in sorted(self.sprites(), key = lambda sprite: sprite.rect.centery):
-            offset_position = sprite.rect.topleft - self.offset
-            self.screen.blit(sprite.image, offset_position)
\ No newline at end of file
+        self._center_target_draw(player)
+
+        # Draw sprites in one batched call rather than one blit each
+        offset = self.offset
+        self.screen.blits([
+            (sprite.image, sprite.rect.topleft - offset)
+            for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery)
+        ])
\ No newline at end of file
@@ -29,7 +29,9 @@ class GraphicalView(object):
         self.isinitialized: bool = False
         self.fps: int = None
         self.meters_to_pixels: float = None
+        self._pixels_per_frame: float = None
         self.screen: pygame.Surface = None
+        self.background: pygame.Surface = None
         self.clock: pygame.time.Clock = None
         self.font: pygame.font.Font = None
         
@@ -160,7 +162,7 @@ class GraphicalView(object):
             f"Rendering the game menu with an FPS of {self.clock.get_fps()}." 
             f"The previous frame took {self.clock.get_time()} milliseconds."
         )
-        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.background, (0, 0))
         self.menu_sprites.update()
         self.menu_sprites.draw(self.screen)
         pygame.display.flip()
@@ -174,7 +176,7 @@ class GraphicalView(object):
             f"Rendering the help menu with an FPS of {self.clock.get_fps()}." 
             f"The previous frame took {self.clock.get_time()} milliseconds."
         )
-        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.background, (0, 0))
         self.help_sprites.update()
         self.help_sprites.draw(self.screen)
         pygame.display.flip()
@@ -188,7 +190,7 @@ class GraphicalView(object):
             f"Rendering the gameplay with an FPS of {self.clock.get_fps()}." 
             f"The previous frame took {self.clock.get_time()} milliseconds."
         )
-        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.background, (0, 0))
         self.play_sprites.update()
         self.play_sprites.camera_draw(self.player)
         self.ui_sprites.update()
@@ -204,10 +206,11 @@ class GraphicalView(object):
         if self.model.character.cast():
             # Setup projectile variables
             source = self.model.character._palette.get_active_item().get_spell()
-            projectile_speed = (source.get_attribute(SpellAttribute.SPEED) * self.meters_to_pixels) / self.fps 
+            speed = source.get_attribute(SpellAttribute.SPEED)
+            projectile_speed = speed * self._pixels_per_frame
             projectile_radius = source.get_attribute(SpellAttribute.RADIUS) * self.meters_to_pixels
-            charge_frames = source.get_attribute(SpellAttribute.CAST_TIME) * self.fps
-            cast_frames = (source.get_attribute(SpellAttribute.DISTANCE) / source.get_attribute(SpellAttribute.SPEED)) * self.fps
+            charge_frames = source.get_attribute(SpellAttribute.CAST_TIME) / 1000 * self.fps
+            cast_frames = (source.get_attribute(SpellAttribute.DISTANCE) / speed) * self.fps
             diameter = math.ceil(projectile_radius * 2)
             
             # Create projectile
@@ -227,9 +230,8 @@ class GraphicalView(object):
                 projectile_radius
             )
 
-            # Add projectile to sprite group
-            self.attack_sprites.add(projectile)
-            self.play_sprites.add(projectile)
+            # Add projectile to both sprite groups in one call
+            projectile.add(self.attack_sprites, self.play_sprites)
             
     def trigger_menuing(self, event: MouseEvent):
         """
@@ -362,11 +364,12 @@ class GraphicalView(object):
         group.add(play_text)
         
         # Setting up palette
+        window_width, window_height = pygame.display.get_window_size()
         self.palette = PaletteSprite(
-            (10, 10), 
+            (10, 10),
             (
-                pygame.display.get_window_size()[0] / 8,
-                pygame.display.get_window_size()[1] / 20
+                window_width / 8,
+                window_height / 20
             ),
             self.model.character._palette,
             self.clock
@@ -384,16 +387,17 @@ class GraphicalView(object):
         
         group = pygame.sprite.Group()
         
+        screen_rect = self.screen.get_rect()
         self.new_game_button = ButtonSprite(
-            (self.screen.get_rect().centerx, self.screen.get_rect().centery + 50), 
-            self.font, 
+            (screen_rect.centerx, screen_rect.centery + 50),
+            self.font,
             "New Game"
         )
         group.add(self.new_game_button)
         
         self.load_game_button = ButtonSprite(
-            (self.screen.get_rect().centerx, self.screen.get_rect().centery + 100), 
-            self.font, 
+            (screen_rect.centerx, screen_rect.centery + 100),
+            self.font,
             "Load Game"
         )
         #group.add(self.load_game_button)
@@ -411,6 +415,7 @@ class GraphicalView(object):
         
         # Initialize some global variables
         self.meters_to_pixels = self.screen.get_width() / self.model.character._view_width
+        self._pixels_per_frame = self.meters_to_pixels / self.fps
 
         # Create sprite groups
         self.attack_sprites = CharacterCameraGroup()
@@ -430,9 +435,17 @@ class GraphicalView(object):
         pygame.init()
         pygame.font.init()
         pygame.display.set_caption('Mage Game')
-        
+
+        # Only let SDL queue the event types the controller handles;
+        # mouse motion in particular fires constantly and was being
+        # converted to Python objects just to be dropped
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
+
         # Initialize graphics fields
         self.screen = pygame.display.set_mode((0, 0))
+        self.background = pygame.Surface(self.screen.get_size()).convert()
+        self.background.fill((0, 0, 0))
         self.clock = pygame.time.Clock()
         self.fps = 30
         self.font = pygame.font.Font(None, 40)
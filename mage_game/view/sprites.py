@@ -3,12 +3,121 @@ import random
 
 import pygame
 from mage_game.view.camera import CharacterCameraGroup
-from pygame import RLEACCEL
+from pygame import RLEACCEL, K_a, K_d, K_s, K_w
 
 from ..model import *
 
 logger = logging.getLogger(__name__)
 
+# A quantized sin/cos lookup table for spells that launch several
+# projectiles at fixed angle offsets (fans, bursts). A table read is a
+# single cached load, so an N-way spread costs no additional trig.
+_ANGLE_STEPS = 1024
+_SIN = tuple(math.sin(2 * math.pi * i / _ANGLE_STEPS) for i in range(_ANGLE_STEPS))
+_COS = tuple(math.cos(2 * math.pi * i / _ANGLE_STEPS) for i in range(_ANGLE_STEPS))
+
+
+def _quantized_components(radians: float) -> tuple:
+    """
+    A helper function that looks up the cosine and sine of an angle
+    from the precomputed table. Accurate to within one part in 1024
+    of a full turn, which is plenty for spacing projectiles in a fan.
+
+    :param radians: an angle in radians
+    :return: the (cosine, sine) of the angle from the lookup table
+    """
+    index = int(radians * _ANGLE_STEPS / (2 * math.pi)) & (_ANGLE_STEPS - 1)
+    return _COS[index], _SIN[index]
+
+
+# The decoded player animation frames, shared by every PlayerSprite
+_PLAYER_FRAMES: list | None = None
+
+
+def _player_frames() -> list:
+    """
+    Lazily loads the player animation frames, caching the decoded
+    surfaces so repeat PlayerSprite constructions skip the disk read
+    and image decode.
+
+    :return: the shared list of player animation frames
+    """
+    global _PLAYER_FRAMES
+    if _PLAYER_FRAMES is None:
+        _PLAYER_FRAMES = [pygame.image.load(f'assets/player{i}.png') for i in range(1, 3)]
+    return _PLAYER_FRAMES
+
+
+# Movement keys paired with their xy directions, so the player update
+# accumulates one shift from a table instead of four separate branches
+_MOVE_KEYS = ((K_w, 0, -1), (K_a, -1, 0), (K_s, 0, 1), (K_d, 1, 0))
+
+
+# Element colors converted to pygame.Color objects once, so per-frame
+# draw calls skip the tuple parsing pygame does on every call otherwise
+_PG_COLORS: dict = {}
+
+
+def _pygame_color(rgb: tuple) -> pygame.Color:
+    """
+    Retrieves the pygame color object for an (r, g, b) tuple,
+    converting and caching it on first use.
+
+    :param rgb: a color in (r, g, b) format
+    :return: the matching shared pygame color object
+    """
+    color = _PG_COLORS.get(rgb)
+    if color is None:
+        color = pygame.Color(*rgb)
+        _PG_COLORS[rgb] = color
+    return color
+
+
+# Pre-rendered circle surfaces shared by every projectile of the same
+# color and radius. Only a handful of combinations exist (one color per
+# element, a few radius levels), so repeat casts skip rasterization.
+_CIRCLE_CACHE: dict = {}
+
+
+def _circle_surface(color: tuple, radius: int) -> pygame.Surface:
+    """
+    Retrieves the pre-rendered circle surface for a color and radius,
+    rasterizing and caching it on first use.
+
+    :param color: the fill color of the circle in (r, g, b) format
+    :param radius: the radius of the circle in pixels
+    :return: a shared surface containing the filled circle
+    """
+    key = (color, radius)
+    surface = _CIRCLE_CACHE.get(key)
+    if surface is None:
+        diameter = radius * 2
+        surface = pygame.Surface((diameter, diameter))
+        surface.fill((255, 255, 255))
+        surface.set_colorkey((255, 255, 255), RLEACCEL)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        surface = surface.convert()
+        _CIRCLE_CACHE[key] = surface
+    return surface
+
+
+def _velocity_components(dx: float, dy: float, speed: float) -> tuple:
+    """
+    A helper function that converts an xy offset and a speed into
+    xy velocity components. Kept at module level so the projectile
+    spawn path pays for plain scalar math only.
+
+    :param dx: the x distance to the target in pixels
+    :param dy: the y distance to the target in pixels
+    :param speed: the speed of the projectile in pixels per frame
+    :return: the xy velocity components in pixels per frame
+    """
+    distance = math.hypot(dx, dy)
+    if distance == 0:
+        return 0.0, 0.0
+    scale = speed / distance
+    return dx * scale, dy * scale
+
 
 class PlayerSprite(pygame.sprite.Sprite):
     """
@@ -25,7 +134,7 @@ class PlayerSprite(pygame.sprite.Sprite):
         super().__init__()
         self.size = size
         self.camera_group = camera_group
-        self.sprites = [pygame.image.load(f'assets/player{i}.png') for i in range(1, 3)]
+        self.sprites = _player_frames()
         self.image = pygame.transform.scale(self.sprites[0], self.size)
         self.image.set_colorkey((255, 255, 255), RLEACCEL)
         self.rect = self.image.get_rect(center=position)
@@ -55,18 +164,20 @@ class PlayerSprite(pygame.sprite.Sprite):
         :param float meters_to_pixels: the meters per pixel conversion rate
         """
         keys = pygame.key.get_pressed()
-        movement = self.source._speed / self.fps
-        if keys[pygame.K_w]:
-            self.source.move_entity(0, -movement)
-        if keys[pygame.K_a]:
-            self.source.move_entity(-movement, 0)
-        if keys[pygame.K_s]:
-            self.source.move_entity(0, movement)
-        if keys[pygame.K_d]:
-            self.source.move_entity(movement, 0)
+        source = self.source
+        movement = source._speed / self.fps
+        x_shift = y_shift = 0
+        for key, x_direction, y_direction in _MOVE_KEYS:
+            if keys[key]:
+                x_shift += x_direction * movement
+                y_shift += y_direction * movement
+        if x_shift or y_shift:
+            source.move_entity(x_shift, y_shift)
+        meters_to_pixels = self.meters_to_pixels
+        coordinates = source.coordinates
         self.position = pygame.math.Vector2(
-            self.source.coordinates.x * self.meters_to_pixels,
-            self.source.coordinates.y * self.meters_to_pixels
+            coordinates.x * meters_to_pixels,
+            coordinates.y * meters_to_pixels
         )
         self.rect.centerx = self.position[0]
         self.rect.centery = self.position[1]
@@ -172,10 +283,10 @@ class ProjectileSprite(pygame.sprite.Sprite):
         self.camera_group = camera_group
         self.enemy_group = enemy_group
 
-        # Generating key sprite attributes
-        self.image = pygame.Surface(size)
-        self.image.fill((255, 255, 255))
-        self.image.set_colorkey((255, 255, 255), RLEACCEL)
+        # Generating key sprite attributes; the image is redrawn every
+        # frame, so a per-pixel alpha surface beats an RLE colorkey,
+        # which would recompress on each mutation
+        self.image = pygame.Surface(size, pygame.SRCALPHA)
         self.rect = self.image.get_rect()
 
         # Frame calculations
@@ -186,6 +297,7 @@ class ProjectileSprite(pygame.sprite.Sprite):
         self.position = None
         self.radius = 1
         self.radius_per_frame = 0
+        self.particle_count = (size[0] * size[1]) // 20
 
         # Collision variables
         self.sprites_hit = []
@@ -199,8 +311,10 @@ class ProjectileSprite(pygame.sprite.Sprite):
         :param speed: the speed at which the spell will move across the screen in pixels/frame
         :param radius: the radius of the spell in pixels
         """
-        self.charge_frames = charge_frames
-        self.cast_frames = cast_frames
+        # Frame counts are quantized up front so the countdowns hit
+        # zero exactly rather than stepping over it
+        self.charge_frames = math.ceil(charge_frames)
+        self.cast_frames = math.ceil(cast_frames)
         self.speed = speed
         self.radius_per_frame = radius / self.cast_frames
         self._position_projectile()
@@ -215,7 +329,7 @@ class ProjectileSprite(pygame.sprite.Sprite):
         elif self.cast_frames > 0:
             self._shoot_animation()
             self._compute_collisions()
-        elif self.cast_frames == 0:
+        else:
             self.kill()
 
     def _charge_animation(self) -> None:
@@ -246,25 +360,25 @@ class ProjectileSprite(pygame.sprite.Sprite):
         Draws a line between the projectile and the mouse.
         """
         pygame.draw.aaline(
-            pygame.display.get_surface(), 
-            self.source.element().color, 
+            pygame.display.get_surface(),
+            _pygame_color(self.source.element().color),
             pygame.mouse.get_pos(),
-            self.position - self.camera_group.offset, 
+            self.position - self.camera_group.offset,
         )
         
     def _particle_animation(self) -> None:
         """
         Adds a nice particle effect to the spells.
         """
-        particle_count = (self.size[0] * self.size[1]) // 20
         particle_color = self._get_adjacent_color(self.source.element().color, random.randint(25, 35))
-        for _ in range(particle_count):
-            x = random.randint(0, self.size[0])
-            y = random.randint(0, self.size[1])
-            pygame.draw.circle(
+        width, height = self.size
+        randint = random.randint
+        draw_circle = pygame.draw.circle
+        for _ in range(self.particle_count):
+            draw_circle(
                 self.image,
                 particle_color,
-                (x, y),
+                (randint(0, width), randint(0, height)),
                 1
             )
             
@@ -276,7 +390,7 @@ class ProjectileSprite(pygame.sprite.Sprite):
         :param degrees: the degrees away out of 360, defaults to 30
         :return: a pygame color object with the color shifted by degrees
         """
-        color = pygame.Color(rgb[0], rgb[1], rgb[2])
+        color = pygame.Color(_pygame_color(rgb))
         h = (color.hsla[0] + degrees) % 360
         color.hsla = (h, color.hsla[1], color.hsla[2], color.hsla[3])
         return color
@@ -285,23 +399,37 @@ class ProjectileSprite(pygame.sprite.Sprite):
         """
         Draws the projectile spell.
         """
-        self.image.fill((255, 255, 255))
-        pygame.draw.circle(
-            self.image,
-            self.source.element().color,
-            self.image.get_rect().center,
-            self.radius
-        )
+        self.image.fill((0, 0, 0, 0))
+        radius = int(self.radius)
+        if radius > 0:
+            circle = _circle_surface(self.source.element().color, radius)
+            self.image.blit(
+                circle,
+                circle.get_rect(center=self.image.get_rect().center)
+            )
+
+    def _mouse_offsets(self) -> tuple:
+        """
+        A helper method that computes the xy distance between the mouse
+        and the origin sprite. The mouse position, origin position, and
+        camera offset are each read exactly once per call to keep
+        round-trips into pygame off the per-frame path.
+
+        :return: the xy distance between the mouse and the origin in pixels
+        """
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        origin_x, origin_y = self.origin.position
+        offset = self.camera_group.offset
+        return mouse_x - (origin_x - offset[0]), mouse_y - (origin_y - offset[1])
 
     def _position_projectile(self) -> None:
         """
-        Positions the projectile away from the player. 
+        Positions the projectile away from the player.
         """
-        dx = pygame.mouse.get_pos()[0] - (self.origin.position[0] - self.camera_group.offset[0])
-        dy = pygame.mouse.get_pos()[1] - (self.origin.position[1] - self.camera_group.offset[1])
-        radians = math.atan2(dy, dx)
-        x = self.origin.image.get_width() * math.cos(radians) + self.origin.position[0]
-        y = self.origin.image.get_width() * math.sin(radians) + self.origin.position[1]
+        dx, dy = self._mouse_offsets()
+        offset_x, offset_y = _velocity_components(dx, dy, self.origin.image.get_width())
+        x = offset_x + self.origin.position[0]
+        y = offset_y + self.origin.position[1]
         self.position = pygame.math.Vector2((x, y))
         self.rect.centerx = self.position[0]
         self.rect.centery = self.position[1]
@@ -313,12 +441,8 @@ class ProjectileSprite(pygame.sprite.Sprite):
 
         :return: the trajectory of the projectile in xy components of pixels/frame
         """
-        dx = pygame.mouse.get_pos()[0] - (self.origin.position[0] - self.camera_group.offset[0])
-        dy = pygame.mouse.get_pos()[1] - (self.origin.position[1] - self.camera_group.offset[1])
-        radians = math.atan2(dy, dx)
-        velocityx = self.speed * math.cos(radians)
-        velocityy = self.speed * math.sin(radians)
-        return pygame.math.Vector2(velocityx, velocityy)
+        dx, dy = self._mouse_offsets()
+        return pygame.math.Vector2(_velocity_components(dx, dy, self.speed))
     
     def _compute_collisions(self):
         """
@@ -353,6 +477,7 @@ class PaletteSprite(pygame.sprite.Sprite):
         self.source: Palette = source
         self.clock: pygame.time.Clock = clock
         self.font = pygame.font.Font(None, 24)
+        self._slot_cache: dict = {}
         
     def _manage_timers(self) -> None:
         """
@@ -361,26 +486,45 @@ class PaletteSprite(pygame.sprite.Sprite):
         self.source.update_casting_time(self.clock.get_time())
         self.source.update_cooldowns(self.clock.get_time())
 
-    def _draw_palette_cell(self, cell: int, left: int, line_width: int, color: tuple) -> None:
+    def _slot_surface(self, cell: int, palette_item: PaletteItem, selected: bool) -> pygame.Surface:
         """
-        A helper method for drawing the palette squares that showcase each 
-        cell in the palette.
+        A helper method that retrieves the pre-rendered surface for a
+        palette cell, rendering and caching it on first use. Each cell
+        only has two appearances (selected or not), so the per-frame
+        redraw collapses to a blit per cell instead of text rendering
+        and rect/circle rasterization.
 
         :param cell: the index of the cell for labeling purposes
-        :param left: the topleft location of the cell
-        :param line_width: the thickness of the line for the cell
-        :param color: the color of the text and line for the cell
-        """
-        cell_index_text = self.font.render(str(cell + 1), True, color)
-        pygame.draw.rect(
-            self.image,
-            color,
-            (left, 0, self.size[0] / 4, self.size[1]),
-            width=line_width,
-            border_radius=5
-        )
-        self.image.blit(cell_index_text, (left + 5, 5))
-        
+        :param palette_item: the palette item shown in the cell
+        :param selected: True if the cell is the active selection
+        :return: a shared surface containing the rendered cell
+        """
+        key = (cell, palette_item.get_spell().element(), selected)
+        surface = self._slot_cache.get(key)
+        if surface is None:
+            line_width = 2
+            width = self.size[0] / 4
+            color = (0, 255, 0) if selected else (255, 255, 255)
+            surface = pygame.Surface((width, self.size[1]))
+            surface.set_colorkey((0, 0, 0), RLEACCEL)
+            icon = _circle_surface(
+                palette_item.get_spell().element().color,
+                int(self.size[1] / 4)
+            )
+            surface.blit(icon, icon.get_rect(center=(width / 2, self.size[1] / 2)))
+            cell_index_text = self.font.render(str(cell + 1), True, color)
+            pygame.draw.rect(
+                surface,
+                color,
+                (0, 0, width, self.size[1]),
+                width=line_width,
+                border_radius=5
+            )
+            surface.blit(cell_index_text, (5, 5))
+            self._slot_cache[key] = surface
+        return surface
+
+
     def _draw_cast_time_animation(self, left: int, line_width: int):
         """
         A helper method that draws the cast time animation on this palette.
@@ -388,7 +532,7 @@ class PaletteSprite(pygame.sprite.Sprite):
         :param left: _description_
         :param line_width: _description_
         """
-        cast_time = self.source.get_active_item().get_spell().get_attribute(SpellAttribute.CAST_TIME) * 1000
+        cast_time = self.source.get_active_item().get_spell().get_attribute(SpellAttribute.CAST_TIME)
         remaining_cast_time = self.source.get_remaining_casting_time()
         ratio = remaining_cast_time / cast_time
         pygame.draw.rect(
@@ -402,36 +546,25 @@ class PaletteSprite(pygame.sprite.Sprite):
             )
         )
         
-    def _draw_spell_icon(self, left, palette_item: PaletteItem):
-        """
-        A helper method that draws the spell icon on the palette.
-
-        :param left: the left position of the spell
-        :param palette_item: the palette item to draw
-        """
-        pygame.draw.circle(
-            self.image,
-            palette_item.get_spell().element().color,
-            (left + self.size[0] / 8, self.size[1] / 2),
-            self.size[1] / 4
-        )
-        
     def _draw_palette(self):
         """
-        A helper method that draws the current palette.
+        A helper method that draws the current palette. Cells come from
+        the pre-rendered slot cache and land in a single batched blit;
+        only the cast time overlay is drawn fresh each frame.
         """
-        left = 0
         line_width = 2
         self.image.fill((0, 0, 0))
-        for i, item in enumerate(self.source.get_items()):
-            if self.source.get_remaining_casting_time() > 0:
-                self._draw_cast_time_animation(left, line_width)
-            self._draw_spell_icon(left, item)
-            if i == self.source.get_active_item_index():
-                self._draw_palette_cell(i, left, line_width, (0, 255, 0))
-            else:
-                self._draw_palette_cell(i, left, line_width, (255, 255, 255))
-            left += self.size[0] / 4
+        casting = self.source.get_remaining_casting_time() > 0
+        active_index = self.source.get_active_item_index()
+        width = self.size[0] / 4
+        items = self.source.get_items()
+        if casting:
+            for i in range(len(items)):
+                self._draw_cast_time_animation(i * width, line_width)
+        self.image.blits([
+            (self._slot_surface(i, item, i == active_index), (i * width, 0))
+            for i, item in enumerate(items)
+        ])
 
     def update(self):
         """